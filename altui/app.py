@@ -1,10 +1,14 @@
+import codecs
 import contextlib
 import dataclasses
 import functools
 import math
+import operator
 import os
+import random
+import threading
 from pathlib import Path
-from typing import Any, Iterator, TypeVar
+from typing import Any, Callable, Iterator, TypeVar
 
 import gdb  # type: ignore[import]
 import rich.markup
@@ -26,6 +30,12 @@ from .gdbapp import (
 
 _T = TypeVar("_T")
 
+# Loaded once at import time; read_bytes plus an explicit decode skips read_text's
+# universal-newline translation.
+_WELCOME_MARKDOWN = Markdown(
+    (Path(__file__).parent / "welcome.md").read_bytes().decode("utf-8")
+)
+
 
 @dataclasses.dataclass(order=True)
 class _BookmarksCellTime:
@@ -54,16 +64,23 @@ class _BookmarksCellTime:
         return Text(self.aligned_time)
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_markup(markup_text: str) -> Text:
+    return Text.from_markup(markup_text)
+
+
 @dataclasses.dataclass(frozen=True, order=True)
 class _BookmarksCellNameAndCommand:
     markup_text: str
     goto_command: str | None
 
     def __rich__(self) -> Text:
-        return Text.from_markup(self.markup_text)
+        # Rich renders the cell on every refresh/scroll, not just when the data changes, so
+        # don't re-parse the markup each time.
+        return _parse_markup(self.markup_text)
 
 
-@dataclasses.dataclass(frozen=True, order=True)
+@dataclasses.dataclass(frozen=True)
 class Variable:
     name: str
     value: str
@@ -75,8 +92,14 @@ class Variable:
         return self.to_string(compact=False)
 
     def to_string(self, *, compact: bool) -> str:
-        space_around_assignement = "" if compact else " "
-        return f"{self.name}{space_around_assignement}={space_around_assignement}{self.value}"
+        if compact:
+            return self.compact_str
+        return f"{self.name} = {self.value}"
+
+    @functools.cached_property
+    def compact_str(self) -> str:
+        # Cached as arguments are formatted both for the backtrace and the threads panel.
+        return f"{self.name}={self.value}"
 
 
 @dataclasses.dataclass(frozen=True)
@@ -95,12 +118,16 @@ class CalledFunction:
 
     level: int
     name: str
-    arguments: list[Variable]
+    arguments: tuple[Variable, ...]
     is_selected: bool
     source: SourceLocation | None
 
     def __str__(self) -> str:
-        formatted_args = ", ".join(arg.to_string(compact=True) for arg in self.arguments)
+        return self.formatted
+
+    @functools.cached_property
+    def formatted(self) -> str:
+        formatted_args = ", ".join([arg.compact_str for arg in self.arguments])
         return f"{self.name} ({formatted_args})"
 
     def source_to_string(self) -> str:
@@ -147,74 +174,264 @@ def iter_function_blocks(frame: gdb.Frame) -> Iterator[gdb.Block]:
         block = block.superblock
 
 
+# Whether to show a placeholder instead of the full value for compound types. Recursively
+# formatting a large array or nested structure can take seconds, which is why GDB/MI grew the
+# --simple-values option; we apply the same heuristic.
+_COMPACT_COMPOUND_VALUES = True
+
+_COMPOUND_TYPE_CODES = frozenset(
+    (
+        gdb.TYPE_CODE_STRUCT,
+        gdb.TYPE_CODE_UNION,
+        gdb.TYPE_CODE_ARRAY,
+    )
+)
+
+
+def format_symbol_value(gdb_symbol: gdb.Symbol, frame: gdb.Frame) -> str:
+    if _COMPACT_COMPOUND_VALUES:
+        stripped_type = gdb_symbol.type.strip_typedefs()
+        if stripped_type.code in _COMPOUND_TYPE_CODES:
+            return f"<{gdb_symbol.type.name or stripped_type}>"
+
+    value = gdb_symbol.value(frame)
+    assert value is not None, f"None value for {gdb_symbol.print_name!r}"  # TODO: superfluous?
+    return str(value)
+
+
 def function_variables(frame: gdb.Frame) -> Iterator[Variable]:
     for block in iter_function_blocks(frame):
         for gdb_symbol in block:
             assert gdb_symbol.print_name is not None  # TODO: superfluous?
             if gdb_symbol.print_name != "__PRETTY_FUNCTION__":
-                value = gdb_symbol.value(frame)
-                assert (
-                    value is not None
-                ), f"None value for {gdb_symbol.print_name!r}"  # TODO: superfluous?
                 yield Variable(
                     name=gdb_symbol.print_name,
-                    value=str(value),
+                    value=format_symbol_value(gdb_symbol, frame),
                     is_argument=gdb_symbol.is_argument,
                 )
 
 
-def function(frame: gdb.Frame) -> CalledFunction:
+# Formatting symbol values dominates the cost of a UI refresh, so the materialized variables
+# are cached by (thread, level, pc) and shared between the backtrace and the variables panel.
+# The thread is part of the key because identical threads stopped at the same instruction
+# collide on level and PC alone, and their locals hold different values. Like the other
+# caches, this is cleared when the target resumes — but only while an app is connected to the
+# cont event, so a new app also drops it on construction in case the target ran while no app
+# was around to notice.
+_variables_cache: dict[tuple[tuple[int, int, int], int, int], tuple[Variable, ...]] = {}
+
+
+def cached_function_variables(frame: gdb.Frame) -> tuple[Variable, ...]:
+    # The frame belongs to the selected thread: the thread iteration switches to each
+    # thread before materializing its frames.
+    key = (gdb.selected_thread().ptid, frame.level(), frame.pc())
+    variables = _variables_cache.get(key)
+    if variables is None:
+        variables = _variables_cache[key] = tuple(function_variables(frame))
+    return variables
+
+
+@functools.lru_cache(maxsize=512)
+def _make_source_location(fullname: str, filename: str, line: int) -> SourceLocation:
+    # Path construction involves string parsing, and the same few locations recur on every
+    # refresh, so share the instances.
+    return SourceLocation(
+        path=Path(fullname),
+        short_path=Path(filename),
+        line=line,
+    )
+
+
+def function(frame: gdb.Frame, *, include_arguments: bool = True) -> CalledFunction:
     sal = frame.find_sal()
     if sal.symtab is not None:
-        source = SourceLocation(
-            path=Path(sal.symtab.fullname()),
-            short_path=Path(sal.symtab.filename),
-            line=sal.line,
-        )
+        source = _make_source_location(sal.symtab.fullname(), sal.symtab.filename, sal.line)
     else:
         source = None
 
     return CalledFunction(
         level=frame.level(),
         name=frame.name() or "???",
-        arguments=[s for s in function_variables(frame) if s.is_argument],
+        # Walking the frame's blocks for arguments is much more expensive than the rest, so
+        # callers which don't display arguments can skip it.
+        arguments=(
+            tuple(s for s in cached_function_variables(frame) if s.is_argument)
+            if include_arguments
+            else ()
+        ),
         is_selected=(frame == gdb.selected_frame()),
         source=source,
     )
 
 
-def stack() -> Iterator[CalledFunction]:
+# Bound on the frames materialized per refresh. Pathologically deep stacks (runaway
+# recursion, say) would otherwise make every prompt take seconds; the full stack is still
+# available from the terminal via the backtrace command.
+_MAX_STACK_FRAMES = 500
+
+
+def stack(
+    frame_cache: dict[tuple[tuple[int, int, int], int, int], CalledFunction] | None = None,
+) -> tuple[list[CalledFunction], bool]:
+    """The materialized frames plus whether any frame was left out due to the cap.
+
+    The flag cannot be derived from the frame count alone: a stack of exactly
+    `_MAX_STACK_FRAMES` frames is complete, and a selection past the cap makes the walk
+    produce one frame more than the cap.
+    """
+    frames: list[CalledFunction] = []
+    truncated = False
+
     try:
         gdbutils.ensure_running()
     except comms.WrongExecutionModeError:
-        return
+        return frames, truncated
 
+    selected_frame = gdb.selected_frame()
+    selected_thread = gdb.selected_thread()
     frame = gdb.newest_frame()
+    selected_seen = False
     while frame is not None:
-        yield function(frame)
+        is_selected = frame == selected_frame
+        if len(frames) >= _MAX_STACK_FRAMES:
+            # Beyond the cap, keep unwinding (which is cheap) only until the selected frame
+            # has been materialized, so the source view and variables always reflect it
+            # even if the user selected a frame deeper than the cap.
+            if selected_seen:
+                truncated = True
+                break
+            if not is_selected:
+                truncated = True
+                frame = frame.older()
+                continue
+        if frame_cache is None:
+            frames.append(function(frame))
+        else:
+            # Crossing the GDB API boundary to materialize a frame (symbols, arguments, etc.)
+            # is expensive, so reuse frames cached from previous stops. The program cannot
+            # have executed in the meantime (the cache is invalidated on resume), so a frame
+            # at the same level with the same PC in the same thread is unchanged, except
+            # possibly for which frame the user selected. The thread is part of the key
+            # because identical threads stopped at the same instruction (a pool blocked in
+            # the same wait loop, say) collide on level and PC alone.
+            key = (selected_thread.ptid, frame.level(), frame.pc())
+            cached = frame_cache.get(key)
+            if cached is None or cached.is_selected != is_selected:
+                cached = frame_cache[key] = function(frame)
+            frames.append(cached)
+        selected_seen = selected_seen or is_selected
         frame = frame.older()
+    return frames, truncated
 
 
-def threads() -> Iterator[Thread]:
+def threads(thread_cache: dict[tuple[int, int], Thread] | None = None) -> Iterator[Thread]:
     selected_gdb_thread = gdb.selected_thread()
     inf = gdb.selected_inferior()
     try:
         for gdb_thread in inf.threads():
-            gdb_thread.switch()
             pid, tid, _ = gdb_thread.ptid
-            yield Thread(
+            is_selected = gdb_thread == selected_gdb_thread
+            if thread_cache is not None and not is_selected:
+                # Switching to a thread just to look at its frame is a heavy GDB operation.
+                # A non-selected thread cannot have executed since the cache was last
+                # invalidated (on resume), so its cached entry is still valid unless it used
+                # to be the selected thread.
+                cached = thread_cache.get((pid, tid))
+                if cached is not None and not cached.is_selected:
+                    yield cached
+                    continue
+            gdb_thread.switch()
+            thread = Thread(
                 num=gdb_thread.num,
                 thread_name=gdb_thread.name,
                 pid=pid,
                 tid=tid,
-                is_selected=(gdb_thread == selected_gdb_thread),
-                function=function(gdb.selected_frame()),
+                is_selected=is_selected,
+                # Only the selected thread gets the full treatment as the Variables panel
+                # only shows the selected frame anyway.
+                function=function(gdb.selected_frame(), include_arguments=is_selected),
             )
+            if thread_cache is not None:
+                thread_cache[(pid, tid)] = thread
+            yield thread
     finally:
         if selected_gdb_thread is not None:
             selected_gdb_thread.switch()
 
 
+@dataclasses.dataclass(frozen=True)
+class Snapshot:
+    """Everything the UI shows about the target, collected in a single pass."""
+
+    stack: list[CalledFunction] = dataclasses.field(default_factory=list)
+    stack_truncated: bool = False
+    threads: list[Thread] = dataclasses.field(default_factory=list)
+    variables: list[Variable] = dataclasses.field(default_factory=list)
+
+
+def collect_snapshot(
+    frame_cache: dict[tuple[int, int], CalledFunction] | None = None,
+    thread_cache: dict[tuple[int, int], Thread] | None = None,
+    stack_cache: dict[tuple[int, int, int], tuple[list[CalledFunction], bool]] | None = None,
+) -> Snapshot:
+    try:
+        gdbutils.ensure_running()
+    except comms.WrongExecutionModeError:
+        return Snapshot()
+
+    selected_frame = gdbutils.selected_frame()
+
+    selected_thread = gdb.selected_thread()
+    prev_stack = None
+    prev_truncated = False
+    if stack_cache is not None and selected_thread is not None:
+        cached_stack = stack_cache.get(selected_thread.ptid)
+        if cached_stack is not None:
+            prev_stack, prev_truncated = cached_stack
+
+    selected_level = selected_frame.level() if selected_frame is not None else None
+    if (
+        prev_stack is not None
+        and selected_level is not None
+        and not any(f.level == selected_level for f in prev_stack)
+    ):
+        # The selection moved to a frame the capped walk left out (see _MAX_STACK_FRAMES);
+        # rebuild so the selected frame is included.
+        prev_stack = None
+
+    if prev_stack is not None:
+        # The target cannot have executed since this stack was captured (the cache is
+        # dropped on resume), so the stack itself is unchanged; only the frame selection can
+        # have moved. Fix up the selection flags instead of walking every frame again.
+        snapshot_stack = [
+            (
+                f
+                if f.is_selected == (f.level == selected_level)
+                else dataclasses.replace(f, is_selected=(f.level == selected_level))
+            )
+            for f in prev_stack
+        ]
+        stack_truncated = prev_truncated
+    else:
+        snapshot_stack, stack_truncated = stack(frame_cache)
+    if stack_cache is not None and selected_thread is not None:
+        stack_cache[selected_thread.ptid] = (snapshot_stack, stack_truncated)
+    return Snapshot(
+        stack=snapshot_stack,
+        stack_truncated=stack_truncated,
+        threads=list(threads(thread_cache)),
+        # stack() just materialized the selected frame's variables into the cache, so this
+        # is a lookup rather than another block walk.
+        variables=(
+            # Sorting by name alone avoids comparing the (potentially long) formatted
+            # values as the generated dataclass ordering would.
+            sorted(cached_function_variables(selected_frame), key=operator.attrgetter("name"))
+            if selected_frame is not None
+            else []
+        ),
+    )
+
+
 class UdbApp(GdbCompatibleApp):
     BINDINGS = [
         ("ctrl+w", "toggle_dark", "Toggle dark mode"),
@@ -284,6 +501,52 @@ class UdbApp(GdbCompatibleApp):
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self._udb: udb_base.Udb = gdb._udb
+        # Frames and threads already materialized at the current stop, see stack() and
+        # threads().
+        self._frame_cache: dict[tuple[tuple[int, int, int], int, int], CalledFunction] = {}
+        self._thread_cache: dict[tuple[int, int], Thread] = {}
+        self._stack_cache: dict[tuple[int, int, int], tuple[list[CalledFunction], bool]] = {}
+        # The variables cache is module level and only invalidated by the cont handler
+        # connected below, so entries surviving from a previous app instance may predate
+        # target execution which happened while no app was connected.
+        _variables_cache.clear()
+
+        # Whether a UI refresh has been requested but not started yet, see _update_ui.
+        self._update_pending = False
+
+        # The last state applied by _change_widgets_enablement.
+        self._widgets_enabled = True
+        # Bumped on every enablement request; lets a debounced disable detect that it was
+        # superseded, see _change_widgets_enablement_debounced.
+        self._enablement_generation = 0
+
+        # Incremented for every refresh collected on the GDB thread; lets the UI thread
+        # drop refreshes that were superseded before it got around to applying them.
+        self._refresh_generation = 0
+
+        # Holds back incomplete UTF-8 sequences which straddle output chunks, see
+        # _process_output_internal.
+        self._output_decoder = codecs.getincrementaldecoder("utf-8")(errors="backslashreplace")
+        # Output chunks accumulated since the last flush, see process_output. Guarded by
+        # the lock as chunks arrive on the I/O thread but are drained on the UI thread.
+        self._output_buffer = bytearray()
+        self._output_flush_pending = False
+        self._output_lock = threading.Lock()
+
+        # The last seen inferior filename and the target name derived from it.
+        self._cached_target_name: tuple[str, str] | None = None
+
+        # The last align_recording_times input and result, see _set_ui_to_values.
+        self._aligned_times_cache: tuple[tuple[engine.Time, ...], list[str]] | None = None
+
+        # The inputs each pane was last populated from, see _pane_inputs_changed.
+        self._last_pane_inputs: dict[str, object] = {}
+        # Rebuilds of panes which were not visible when their inputs changed, keyed by pane
+        # name and run when the relevant tab is activated. See _populate_pane.
+        self._pending_pane_updates: dict[str, Callable[[], None]] = {}
+        # The source path currently shown, remembered across refreshes which skip the
+        # backtrace pane.
+        self._current_source_path: Path | None = None
 
         super().__init__(*args, **kwargs)
 
@@ -377,7 +640,42 @@ class UdbApp(GdbCompatibleApp):
     @ui_thread_only
     @fatal_exceptions
     def on_ready(self) -> None:
-        term = self.query_one("#terminal", terminal.Terminal)
+        # Resolve the widgets used on hot paths once and for all; query_one walks the DOM on
+        # every call. The set of widgets is fixed after compose().
+        self._w_terminal = self.query_one("#terminal", terminal.Terminal)
+        self._w_code = self.query_one("#code", udbwidgets.SourceView)
+        self._w_backtrace: udbwidgets.UdbListView[CalledFunction] = self.query_one(
+            "#backtrace", udbwidgets.UdbListView
+        )
+        self._w_threads: udbwidgets.UdbListView[Thread] = self.query_one(
+            "#threads", udbwidgets.UdbListView
+        )
+        self._w_variables: udbwidgets.UdbListView[Variable] = self.query_one(
+            "#variables", udbwidgets.UdbListView
+        )
+        self._w_variables_toolbar = self.query_one("#variables-toolbar", udbwidgets.UdbToolbar)
+        self._w_bookmarks = self.query_one("#bookmarks", udbwidgets.UdbTable)
+        self._w_continue_last = self.query_one("#continue-last", containers.Vertical)
+        self._w_continue_last_text = self.query_one("#continue-last-text", widgets.Static)
+        self._w_continue_last_expression = self.query_one(
+            "#continue-last-expression", widgets.Static
+        )
+        self._w_status_bar = self.query_one(status_bar.StatusBar)
+        self._w_progress_panel = self.query_one("#progress_panel", containers.Horizontal)
+        self._w_progress_indicator = self.query_one("#progress_indicator", widgets.ProgressBar)
+        self._disable_on_execution_widgets = list(self.query(".disable-on-execution"))
+
+        # Which TabbedContent hosts each deferrable pane, used to tell whether a pane is
+        # visible without walking the DOM.
+        self._pane_tabbed_content: dict[str, widgets.TabbedContent] = {}
+        for tabbed_content in self.query(widgets.TabbedContent):
+            for tab_pane in tabbed_content.query(widgets.TabPane):
+                assert tab_pane.id is not None
+                self._pane_tabbed_content[
+                    tab_pane.id.removesuffix("-tab-pane")
+                ] = tabbed_content
+
+        term = self._w_terminal
         term.focus()
         term.attach_to_tty(
             fd=self.configuration.gdb_io_fd,
@@ -385,11 +683,17 @@ class UdbApp(GdbCompatibleApp):
             read_from_tty=False,
         )
 
-        code = self.query_one("#code", udbwidgets.SourceView)
-        code.write(Markdown((Path(__file__).parent / "welcome.md").read_text(encoding="utf-8")))
+        self._w_code.write(_WELCOME_MARKDOWN)
 
         def change_widgets_enablement_gdb_thread(enabled: bool, event: gdb.ThreadEvent) -> None:
-            self.on_ui_thread(self._change_widgets_enablement, enabled)
+            if not enabled:
+                # The target is about to execute, so any cached frames and threads are
+                # stale.
+                self._frame_cache.clear()
+                self._thread_cache.clear()
+                self._stack_cache.clear()
+                _variables_cache.clear()
+            self.on_ui_thread(self._change_widgets_enablement_debounced, enabled)
 
         self.connect_event_thread_safe(gdb.events.before_prompt, self._update_ui)
         self.connect_event_thread_safe(gdb.events.cont, change_widgets_enablement_gdb_thread, False)
@@ -400,45 +704,93 @@ class UdbApp(GdbCompatibleApp):
         self._update_ui()
 
     @classmethod
-    def process_output(cls, buff: bytes) -> bool:
+    def process_output(cls, buff: bytes | memoryview) -> bool:
         with cls.locked_get_instance() as instance:
             if instance is None:
                 # We cannot deal with the output as there's no app running.
                 return False
 
+            # Chatty inferiors produce output in many small chunks; buffering them and
+            # scheduling a single flush means one UI wake-up and one repaint per burst
+            # instead of one per chunk.
             # Pylint doesn't know that instance is an instance of this class.
             # pylint: disable=protected-access
-            instance.on_ui_thread(instance._process_output_internal, buff)
+            with instance._output_lock:
+                instance._output_buffer += buff
+                schedule_flush = not instance._output_flush_pending
+                instance._output_flush_pending = True
+            if schedule_flush:
+                instance.on_ui_thread(instance._process_output_internal)
             return True
 
     @ui_thread_only
     # We cannot rely on logging exception (done by `ui_thread_only` via `log_exceptions`) as, to
     # log them, we need to go through this function.
     @fatal_exceptions
-    def _process_output_internal(self, buff: bytes) -> None:
-        if self._is_ready:
-            self.query_one(terminal.Terminal).process_output(
-                buff.decode("utf-8", errors="backslashreplace")
-            )
+    def _process_output_internal(self) -> None:
+        with self._output_lock:
+            buff = bytes(self._output_buffer)
+            self._output_buffer.clear()
+            self._output_flush_pending = False
+        if self._is_ready and buff:
+            self._w_terminal.process_output(self._output_decoder.decode(buff))
+
+    @ui_thread_only
+    def _change_widgets_enablement_debounced(self, enabled: bool) -> None:
+        # When stepping, cont and stop arrive within milliseconds of each other; disabling
+        # the widgets just to re-enable them would restyle everything twice per step.
+        # Enables apply immediately, disables only if no newer request lands first.
+        self._enablement_generation += 1
+        if enabled:
+            self._change_widgets_enablement(True)
+            return
+
+        generation = self._enablement_generation
+
+        def apply() -> None:
+            if generation == self._enablement_generation:
+                self._change_widgets_enablement(False)
+
+        self.set_timer(0.05, apply)
 
     @ui_thread_only
     def _change_widgets_enablement(self, enabled: bool) -> None:
-        for widget in self.query(".disable-on-execution"):
+        # cont/stop fire in quick succession while stepping; don't touch the widgets if
+        # they are already in the requested state.
+        if enabled == self._widgets_enabled:
+            return
+        self._widgets_enabled = enabled
+        for widget in self._disable_on_execution_widgets:
             widget.disabled = not enabled
 
     def _update_ui(self) -> None:
+        # A single user action can request several refreshes in quick succession (for
+        # instance, before_prompt plus a frame-selection handler). Requests made while one is
+        # already queued are dropped: the queued refresh hasn't started yet, so it will
+        # observe the latest state anyway.
+        if self._update_pending:
+            return
+        self._update_pending = True
         self.on_gdb_thread(self._update_ui_callback)
 
     @gdb_thread_only
     def _update_ui_callback(self) -> None:
+        # Cleared before doing any work so a request arriving mid-refresh schedules a new
+        # refresh rather than being lost.
+        self._update_pending = False
+
         if self.get_instance() is not self:
             return
 
+        # Before the UI is ready there are no widgets to update; the snapshot would be
+        # thrown away, so don't pay for collecting it (e.g. during sourced startup scripts).
+        if not self._is_ready:
+            return
+
         if gdbutils.is_tui_enabled():
             gdb.execute("tui disable")
 
         target_name = None
-        selected_frame = None
         time_extent = None
         current_time = None
         bookmarks = []
@@ -451,9 +803,10 @@ class UdbApp(GdbCompatibleApp):
             else:
                 filename = selected_inferior.gdb_inferior.progspace.filename
                 if filename is not None:
-                    target_name = Path(filename).name
-
-            selected_frame = gdbutils.selected_frame()
+                    # The filename rarely changes, so skip re-parsing it into a Path.
+                    if self._cached_target_name is None or self._cached_target_name[0] != filename:
+                        self._cached_target_name = (filename, Path(filename).name)
+                    target_name = self._cached_target_name[1]
 
             current_time = self._udb.time.get()
             time_extent = self._udb.get_event_log_extent()
@@ -464,13 +817,19 @@ class UdbApp(GdbCompatibleApp):
             with contextlib.suppress(StopIteration):
                 time_next_redo = next(self._udb.time.redo_items)
 
+        snapshot = collect_snapshot(self._frame_cache, self._thread_cache, self._stack_cache)
+
+        # During rapid stepping the UI thread can fall behind the prompts; stamping each
+        # refresh lets _set_ui_to_values drop any that a newer one has superseded.
+        self._refresh_generation += 1
+
         self.on_ui_thread(
             self._set_ui_to_values,
-            stack=list(stack()),
-            threads=list(threads()),
-            variables=(
-                sorted(function_variables(selected_frame)) if selected_frame is not None else []
-            ),
+            generation=self._refresh_generation,
+            stack=snapshot.stack,
+            stack_truncated=snapshot.stack_truncated,
+            threads=snapshot.threads,
+            variables=snapshot.variables,
             execution_mode=self._udb.get_execution_mode(),
             current_time=current_time,
             time_extent=time_extent,
@@ -481,11 +840,24 @@ class UdbApp(GdbCompatibleApp):
             last_search=self._udb.last._latest_search,  # pylint: disable=protected-access
         )
 
+    def _pane_inputs_changed(self, pane: str, value: object) -> bool:
+        """Whether `pane` needs re-populating because `value` differs from what it was last
+        populated from.
+
+        Rebuilding a widget (clear plus re-append) is expensive in Textual, so panes whose
+        inputs are unchanged since the previous refresh are skipped entirely.
+        """
+        if self._last_pane_inputs.get(pane) == value:
+            return False
+        self._last_pane_inputs[pane] = value
+        return True
 
     @ui_thread_only
     def _set_ui_to_values(
         self,
+        generation: int,
         stack: list[CalledFunction],
+        stack_truncated: bool,
         threads: list[Thread],
         variables: list[Variable],
         execution_mode: engine.ExecutionMode,
@@ -497,80 +869,171 @@ class UdbApp(GdbCompatibleApp):
         time_next_redo: engine.Time | None,
         last_search: Any,
     ) -> None:
-        bt_lv: udbwidgets.UdbListView[CalledFunction] = self.query_one(
-            "#backtrace", udbwidgets.UdbListView
+        # A newer refresh is already queued behind this one; let it do the work instead of
+        # applying values which are about to be overwritten.
+        if generation != self._refresh_generation:
+            return
+
+        if self._pane_inputs_changed("backtrace", stack):
+            curr_function: CalledFunction | None = None
+            for f in stack:
+                if f.is_selected:
+                    assert curr_function is None, (
+                        f"Two functions appear to be the current function: "
+                        f"{curr_function} ({curr_function.source_to_string()}) and "
+                        f"{f} ({f.source_to_string()})"
+                    )
+                    curr_function = f
+
+            self._populate_pane(
+                "backtrace",
+                functools.partial(self._populate_backtrace, stack, stack_truncated),
+            )
+
+            # The source view is always visible, so it's updated right away.
+            code = self._w_code
+            if curr_function is not None and curr_function.source is not None:
+                code.path = self._current_source_path = curr_function.source.path
+                code.current_line = curr_function.source.line
+                code.border_title = str(curr_function.source.short_path)
+            else:
+                code.path = None
+                code.current_line = None
+                code.border_title = None
+                self._current_source_path = None
+
+        if self._pane_inputs_changed("threads", threads):
+            self._populate_pane("threads", functools.partial(self._populate_threads, threads))
+
+        if self._pane_inputs_changed("variables", variables):
+            self._populate_pane(
+                "variables", functools.partial(self._populate_variables, variables)
+            )
+
+        if last_search is not None:
+            self._w_continue_last_text.update(
+                "Continue search for value changes "
+                + ("without re-evaluating:" if last_search.addr_range is not None else "to:")
+            )
+            self._w_continue_last_expression.update(
+                Text(f"  {last_search.expression}", no_wrap=True, overflow="ellipsis")
+            )
+            for btn_id in "last-backward", "last-forward":
+                if self.query_one(f"#{btn_id}", widgets.Button).has_focus:
+                    self.query_one(f"#continue-{btn_id}", widgets.Button).focus()
+                    break
+
+        self._w_continue_last.styles.display = "block" if last_search is not None else "none"
+
+        if self._pane_inputs_changed(
+            "bookmarks",
+            (bookmarks, current_time, time_extent, time_next_undo, time_next_redo, execution_mode),
+        ):
+            self._populate_pane(
+                "bookmarks",
+                functools.partial(
+                    self._populate_bookmarks,
+                    bookmarks=bookmarks,
+                    current_time=current_time,
+                    time_extent=time_extent,
+                    time_next_undo=time_next_undo,
+                    time_next_redo=time_next_redo,
+                    execution_mode=execution_mode,
+                ),
+            )
+
+        self._w_status_bar.update(
+            execution_mode=execution_mode,
+            target_name=target_name,
+            time=current_time,
+            time_extent=time_extent,
+            source_path=self._current_source_path,
         )
+
+    def _populate_pane(self, pane: str, populate: Callable[[], None]) -> None:
+        """Run `populate` now if `pane` is currently visible, otherwise defer it.
+
+        The user cannot see an inactive tab, so its (expensive) rebuild is delayed until the
+        tab is activated; meanwhile newer deferred rebuilds simply replace older ones.
+        """
+        if self._pane_is_visible(pane):
+            self._pending_pane_updates.pop(pane, None)
+            populate()
+        else:
+            self._pending_pane_updates[pane] = populate
+
+    def _pane_is_visible(self, pane: str) -> bool:
+        tabbed_content = self._pane_tabbed_content.get(pane)
+        if tabbed_content is None:
+            return True
+        return tabbed_content.active == f"{pane}-tab-pane"
+
+    @on(widgets.TabbedContent.TabActivated)
+    @ui_thread_only
+    def _tab_activated(self, event: widgets.TabbedContent.TabActivated) -> None:
+        pane = (event.tab.id or "").removesuffix("-tab-pane")
+        populate = self._pending_pane_updates.pop(pane, None)
+        if populate is not None:
+            populate()
+
+    @ui_thread_only
+    def _populate_backtrace(self, stack: list[CalledFunction], truncated: bool) -> None:
+        bt_lv = self._w_backtrace
         bt_lv.clear()
-        curr_function: CalledFunction | None = None
+        bt_lv.extend((str(f), f.source_to_string(), f) for f in stack)
+        if truncated:
+            # Not "the first n frames" as a selection past the cap is shown too.
+            bt_lv.append(
+                "(not all frames are shown)",
+                "Use the backtrace command in the terminal to see the whole stack.",
+            )
         for i, f in enumerate(stack):
-            bt_lv.append(str(f), f.source_to_string(), extra=f)
             if f.is_selected:
-                assert curr_function is None, (
-                    f"Two functions appear to be the current function: "
-                    f"{curr_function} ({curr_function.source_to_string()}) and "
-                    f"{f} ({f.source_to_string()})"
-                )
-                curr_function = f
                 bt_lv.move_cursor(row=i)
+                break
 
-        code = self.query_one("#code", udbwidgets.SourceView)
-        source_path = None
-        if curr_function is not None and curr_function.source is not None:
-            code.path = source_path = curr_function.source.path
-            code.current_line = curr_function.source.line
-            code.border_title = str(curr_function.source.short_path)
-        else:
-            code.path = None
-            code.current_line = None
-            code.border_title = None
-
-        threads_lv: udbwidgets.UdbListView[Thread] = self.query_one(
-            "#threads", udbwidgets.UdbListView
-        )
+    @ui_thread_only
+    def _populate_threads(self, threads: list[Thread]) -> None:
+        threads_lv = self._w_threads
         threads_lv.clear()
-        for i, thread in enumerate(threads):
+
+        def thread_item(thread: Thread) -> tuple[str, str, Thread]:
             thread_label = f"[{thread.num}] "
             indent = " " * len(thread_label)
-            # TODO: is the name correct/useful? If not, consider making one from the PID/TID like
-            # GDB does (`Thread 3088776.3088776`).
-            threads_lv.append(
+            # TODO: is the name correct/useful? If not, consider making one from the PID/TID
+            # like GDB does (`Thread 3088776.3088776`).
+            return (
                 f"{thread_label}{thread.name or ''}".rstrip(),
                 (f"{indent}{thread.function}\n" f"{indent}{thread.function.source}"),
-                extra=thread,
+                thread,
             )
+
+        threads_lv.extend(thread_item(thread) for thread in threads)
+        for i, thread in enumerate(threads):
             if thread.is_selected:
                 threads_lv.move_cursor(row=i)
+                break
 
-        vars_lv: udbwidgets.UdbListView[Variable] = self.query_one(
-            "#variables", udbwidgets.UdbListView
-        )
+    @ui_thread_only
+    def _populate_variables(self, variables: list[Variable]) -> None:
+        vars_lv = self._w_variables
         vars_lv.clear()
-        for v in variables:
-            vars_lv.append(str(v), extra=v)
+        vars_lv.extend((str(v), None, v) for v in variables)
 
         # If there is any variable then one must be selected.
-        self.query_one("#variables-toolbar", udbwidgets.UdbToolbar).disabled = (
-            vars_lv.row_count == 0
-        )
+        self._w_variables_toolbar.disabled = vars_lv.row_count == 0
 
-        if last_search is not None:
-            self.query_one("#continue-last-text", widgets.Static).update(
-                "Continue search for value changes "
-                + ("without re-evaluating:" if last_search.addr_range is not None else "to:")
-            )
-            self.query_one("#continue-last-expression", widgets.Static).update(
-                Text(f"  {last_search.expression}", no_wrap=True, overflow="ellipsis")
-            )
-            for btn_id in "last-backward", "last-forward":
-                if self.query_one(f"#{btn_id}", widgets.Button).has_focus:
-                    self.query_one(f"#continue-{btn_id}", widgets.Button).focus()
-                    break
-
-        self.query_one("#continue-last", containers.Vertical).styles.display = (
-            "block" if last_search is not None else "none"
-        )
-
-        bookmarks_table = self.query_one("#bookmarks", udbwidgets.UdbTable)
+    @ui_thread_only
+    def _populate_bookmarks(
+        self,
+        bookmarks: list[tuple[str, engine.Time]],
+        current_time: engine.Time | None,
+        time_extent: engine.LogExtent | None,
+        time_next_undo: engine.Time | None,
+        time_next_redo: engine.Time | None,
+        execution_mode: engine.ExecutionMode,
+    ) -> None:
+        bookmarks_table = self._w_bookmarks
         bookmarks_table.clear()
         bookmarks_rows: list[tuple[_BookmarksCellTime, _BookmarksCellNameAndCommand]] = []
         seen_row_with_current_time = False
@@ -633,7 +1096,7 @@ class UdbApp(GdbCompatibleApp):
                 sort_weight=-10,
                 overwrite_pc=-math.inf,
             )
-            at_end = self._udb.get_execution_mode() is engine.ExecutionMode.RECORDING
+            at_end = execution_mode is engine.ExecutionMode.RECORDING
             assert current_time is not None
             add_bookmark_row(
                     current_time if at_end else engine.Time(time_extent.end),
@@ -647,34 +1110,34 @@ class UdbApp(GdbCompatibleApp):
         if current_time is not None and not seen_row_with_current_time:
             add_bookmark_row(current_time, f"[italic][dim](current time)[/dim][/italic]", None)
 
-        aligned_times = textutil.align_recording_times(map(lambda row: row[0].time, bookmarks_rows))
+        # Sorting the rows before insertion means the table never needs re-sorting, which
+        # would make DataTable recompute its ordering on top of the per-row work already done
+        # by add_row. It also means rows can be addressed by insertion index directly.
+        bookmarks_rows.sort()
+
+        # Aligning the times is pure formatting work, so reuse the previous result when the
+        # set of times to show is unchanged (the common case when just stepping around).
+        times = tuple(row[0].time for row in bookmarks_rows)
+        if self._aligned_times_cache is not None and self._aligned_times_cache[0] == times:
+            aligned_times = self._aligned_times_cache[1]
+        else:
+            aligned_times = list(textutil.align_recording_times(times))
+            self._aligned_times_cache = (times, aligned_times)
         row_with_current_time = None
-        for (cell_time, cell_name), aligned_time in zip(bookmarks_rows, aligned_times):
+        for i, ((cell_time, cell_name), aligned_time) in enumerate(
+            zip(bookmarks_rows, aligned_times)
+        ):
             cell_time.aligned_time = aligned_time
             at_current_time = cell_time.time == current_time
-            row = bookmarks_table.add_row(
+            bookmarks_table.add_row(
                 self._CURRENT_ITEM_MARKER if at_current_time else "",
                 cell_name,
                 cell_time,
             )
             if at_current_time and row_with_current_time is None:
-                row_with_current_time = row
-        bookmarks_table.sort(self._BOOKMARKS_TIME_COLUMN, self._BOOKMARKS_NAME_COLUMN)
+                row_with_current_time = i
         if row_with_current_time is not None:
-            # https://github.com/Textualize/textual/issues/2587.
-            row_index = bookmarks_table._row_locations.get(  # pylint: disable=protected-access
-                row_with_current_time
-            )
-            bookmarks_table.move_cursor(row=row_index)
-
-        status = self.query_one(status_bar.StatusBar)
-        status.update(
-            execution_mode=execution_mode,
-            target_name=target_name,
-            time=current_time,
-            time_extent=time_extent,
-            source_path=source_path,
-        )
+            bookmarks_table.move_cursor(row=row_with_current_time)
 
     @on(udbwidgets.UdbListView.ItemSelected, "#backtrace")
     @ui_thread_only
@@ -703,8 +1166,7 @@ class UdbApp(GdbCompatibleApp):
     @on(udbwidgets.UdbTable.RowSelected, "#bookmarks")
     @ui_thread_only
     def _bookmark_selected(self, event: udbwidgets.UdbTable.RowSelected) -> None:
-        bookmarks_table = self.query_one("#bookmarks", udbwidgets.UdbTable)
-        cell: _BookmarksCellNameAndCommand = bookmarks_table.get_cell(
+        cell: _BookmarksCellNameAndCommand = self._w_bookmarks.get_cell(
             row_key=event.row_key,
             # https://github.com/Textualize/textual/issues/2586.
             column_key=self._BOOKMARKS_NAME_COLUMN,  # type: ignore[arg-type]
@@ -723,10 +1185,7 @@ class UdbApp(GdbCompatibleApp):
             cmd.append("-f")
 
         if event.button.id is not None and "continue" not in event.button.id:
-            table: udbwidgets.UdbListView[Variable] = self.query_one(
-                "#variables",
-                udbwidgets.UdbListView,
-            )
+            table = self._w_variables
             cell = table.get_cell_at(table.cursor_coordinate)
             var = cell.extra
             assert (
@@ -740,13 +1199,13 @@ class UdbApp(GdbCompatibleApp):
     @ui_thread_only
     def _last_cancel_pressed(self, event: widgets.Button.Pressed):
         self._udb.last._latest_search = None  # pylint: disable=protected-access
-        self.query_one("#continue-last", containers.Vertical).styles.display = "none"
+        self._w_continue_last.styles.display = "none"
 
     @ui_thread_only
     def progress_show(self) -> None:
-        term = self.query_one("#terminal", terminal.Terminal)
-        progress_panel = self.query_one("#progress_panel", containers.Horizontal)
-        progress_indicator = self.query_one("#progress_indicator", widgets.ProgressBar)
+        term = self._w_terminal
+        progress_panel = self._w_progress_panel
+        progress_indicator = self._w_progress_indicator
 
         progress_panel.styles.display = "block"
         progress_panel.styles.width = w = progress_indicator.virtual_region_with_margin.width + 4
@@ -762,18 +1221,42 @@ class UdbApp(GdbCompatibleApp):
 
     @ui_thread_only
     def progress_hide(self) -> None:
-        progress_panel = self.query_one("#progress_panel", containers.Horizontal)
-        progress_panel.styles.display = "none"
+        self._w_progress_panel.styles.display = "none"
 
     @ui_thread_only
     def progress_update(self, total: int) -> None:
-        progress_indicator = self.query_one("#progress_indicator", widgets.ProgressBar)
-        progress_indicator.update(progress=total)
+        self._w_progress_indicator.update(progress=total)
+
+    @ui_thread_only
+    def _start_fake_progress(self) -> None:
+        """Animate the progress indicator with made-up values, see the fake-progress command.
+
+        The whole animation runs on the UI thread via timers, so the invoking thread isn't
+        blocked and no per-tick cross-thread hops are needed.
+        """
+        value = 0
+
+        def tick() -> None:
+            nonlocal value
+            value = min(value + random.choice([1, 3, 7, 11, 15]), 100)
+            self.progress_update(value)
+            if value == 100:
+                self.set_timer(0.3, finish)
+            else:
+                self.set_timer(0.6, tick)
+
+        def finish() -> None:
+            self.progress_hide()
+            self._change_widgets_enablement(True)
+
+        self._change_widgets_enablement(False)
+        self.progress_show()
+        self.set_timer(0.6, tick)
 
     @ui_thread_only
     def _action_expand(self) -> None:
-        term = self.query_one("#terminal", terminal.Terminal)
-        code = self.query_one("#code", udbwidgets.SourceView)
+        term = self._w_terminal
+        code = self._w_code
 
         if term.styles.min_height is None:
             term.styles.min_height = term.outer_size.height + code.outer_size.height - 5
@@ -1,5 +1,3 @@
-import random
-import time
 from typing import Callable
 
 import gdb  # type: ignore[import]
@@ -44,26 +42,10 @@ class _FakeProgress(gdb.Command):
         if instance is None:
             raise gdb.GdbError(f"This command only works under altui.")
 
+        # The animation is driven by UI-thread timers, so this returns immediately instead
+        # of sleeping on the GDB thread and posting every tick across threads.
         # pylint: disable=protected-access
-        try:
-            instance.on_ui_thread_wait(instance._change_widgets_enablement, False)
-            instance.on_ui_thread(instance.progress_show)
-
-            progress = 0
-            while True:
-                time.sleep(0.6)
-                progress = min(
-                    progress + random.choice([1, 3, 7, 11, 15]),
-                    100,
-                )
-                instance.on_ui_thread(instance.progress_update, progress)
-                if progress == 100:
-                    break
-
-            time.sleep(0.3)
-        finally:
-            instance.on_ui_thread(instance.progress_hide)
-            instance.on_ui_thread(instance._change_widgets_enablement, True)
+        instance.on_ui_thread(instance._start_fake_progress)
 
 
 def register(configuration: gdbsupport.Configuration | None, err_msg: str | None) -> None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import collections
 import contextlib
 import functools
 import os
@@ -20,14 +21,63 @@ _GdbCompatibleAppT = TypeVar("_GdbCompatibleAppT", bound="GdbCompatibleApp")
 
 _app_instance: GdbCompatibleApp | None = None
 
+# Thread checks run on every decorated call; comparing idents via threading.get_ident (a
+# C-level constant-time call) is cheaper than materializing thread objects each time. The
+# thread object itself is kept for liveness checks on the posting paths.
+_MAIN_THREAD = threading.main_thread()
+_MAIN_THREAD_IDENT = _MAIN_THREAD.ident
+
+# Callbacks waiting to run on the GDB thread, see on_gdb_thread. A burst of callbacks is
+# drained by a single posted trampoline rather than one gdb.post_event wakeup each. The
+# arguments are kept alongside the callback instead of wrapped in a functools.partial,
+# saving one allocation per posted callback.
+_gdb_pending_lock = threading.Lock()
+_gdb_pending: collections.deque[tuple[Callable[..., None], tuple, dict]] = collections.deque()
+
+
+def _drain_gdb_pending() -> None:
+    with _gdb_pending_lock:
+        callbacks = list(_gdb_pending)
+        _gdb_pending.clear()
+    for callback, args, kwargs in callbacks:
+        try:
+            callback(*args, **kwargs)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # GDB would have printed the exception had the callback been posted directly;
+            # do the same so one failure doesn't drop the rest of the batch.
+            traceback.print_exc()
+
 
-@functools.lru_cache(52)
 def _make_ctrl_from_char(char: str) -> str:
     char = char.upper()
     assert len(char) == 1 and ord("A") <= ord(char) <= ord("Z"), f"Invalid char: {char!r}"
     return chr(ord(char) - ord("A") + 1)
 
 
+# ctrl-a ctrl-k: move to the start of the line and clear it, leaving a clean prompt for
+# the command which follows. Precomputed as terminal_execute runs per UI-driven command.
+_CLEAR_PROMPT_PREFIX = _make_ctrl_from_char("A") + _make_ctrl_from_char("K")
+
+
+def _invoke_logging_exceptions(
+    callback: Callable[..., _T],
+    *args: Any,
+    **kwargs: Any,
+) -> _T | None:
+    """Call `callback`, logging rather than propagating exceptions.
+
+    Equivalent to `log_exceptions(callback)(...)` but without allocating a wrapper
+    closure, as the dispatch helpers call this for every posted callback.
+    """
+    try:
+        return callback(*args, **kwargs)
+    except Exception:  # pylint: disable=broad-exception-caught
+        # When productising, consider printing the full stack trace only in tests.
+        tb = traceback.format_exc().rstrip("\n")
+        GdbCompatibleApp.on_gdb_thread(print, tb)
+        return None
+
+
 def log_exceptions(func: Callable[_P, _T | None]) -> Callable[_P, _T | None]:
     @functools.wraps(func)
     def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _T | None:
@@ -77,7 +127,20 @@ def ui_thread_only_without_handling_exceptions(
 def ui_thread_only(
     func: Callable[Concatenate[_GdbCompatibleAppT, _P], _T]
 ) -> Callable[Concatenate[_GdbCompatibleAppT, _P], _T | None]:
-    return ui_thread_only_without_handling_exceptions(log_exceptions(func))
+    # Fused equivalent of ui_thread_only_without_handling_exceptions(log_exceptions(func)):
+    # this decorates most UI methods, so one wrapper frame per call instead of two.
+    @functools.wraps(func)
+    def wrapper(self: _GdbCompatibleAppT, *args: _P.args, **kwargs: _P.kwargs) -> _T | None:
+        self._assert_in_ui_thread(func.__name__)  # pylint: disable=protected-access
+        try:
+            return func(self, *args, **kwargs)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # When productising, consider printing the full stack trace only in tests.
+            tb = traceback.format_exc().rstrip("\n")
+            GdbCompatibleApp.on_gdb_thread(print, tb)
+            return None
+
+    return wrapper
 
 
 def gdb_thread_only(
@@ -85,7 +148,7 @@ def gdb_thread_only(
 ) -> Callable[Concatenate[_GdbCompatibleAppT, _P], _T]:
     @functools.wraps(func)
     def wrapper(self: _GdbCompatibleAppT, *args: _P.args, **kwargs: _P.kwargs) -> _T:
-        if threading.current_thread() is not threading.main_thread():
+        if threading.get_ident() != _MAIN_THREAD_IDENT:
             self.configuration.handle_fatal_error(
                 msg=f"{func.__name__} can only be executed on the main thread"
             )
@@ -135,7 +198,7 @@ class GdbCompatibleApp(App):
             original_tty_attrs = termios.tcgetattr(configuration.real_tty_streams.stdout_fd)
 
             try:
-                self = cls(configuration, thread, init_barrier, *args, **kwargs)
+                self = cls(configuration, thread, ready_event, *args, **kwargs)
                 self.run()
             finally:
                 if threading.main_thread().is_alive():
@@ -153,13 +216,15 @@ class GdbCompatibleApp(App):
             if instance is not None:
                 raise gdb.GdbError("Already enabled.")
 
-            init_barrier = threading.Barrier(2)
+            # A one-shot handoff: the UI thread signals readiness once and never waits
+            # itself, so an Event is enough (and lighter than a Barrier).
+            ready_event = threading.Event()
             thread = configuration.make_thread(run, "ui", daemon=True)
             thread.start()
-            init_barrier.wait()
+            ready_event.wait()
 
     def _assert_in_ui_thread(self, func_name: str = "this function") -> None:
-        if threading.current_thread() is not self._thread:
+        if threading.get_ident() != self._thread.ident:
             self.configuration.handle_fatal_error(
                 msg=f"{func_name} can only be executed on the UI thread"
             )
@@ -181,13 +246,13 @@ class GdbCompatibleApp(App):
         self,
         configuration: gdbsupport.Configuration,
         thread: threading.Thread,
-        init_barrier: threading.Barrier,
+        ready_event: threading.Event,
         *args,
         **kwargs,
     ) -> None:
         self.configuration = configuration
         self._thread = thread
-        self._init_barrier = init_barrier
+        self._ready_event = ready_event
 
         self._is_ready = False
 
@@ -217,7 +282,7 @@ class GdbCompatibleApp(App):
         ioutil.allow_ctrl_c_handling(self.configuration.real_tty_streams.stdin_fd)
 
         self._is_ready = True
-        self._init_barrier.wait()
+        self._ready_event.set()
 
     @fatal_exceptions
     def exit(self, *args: Any, _use_locked_get_instance: bool = True, **kwargs: Any) -> None:
@@ -242,7 +307,7 @@ class GdbCompatibleApp(App):
         *args: _P.args,
         **kwargs: _P.kwargs,
     ) -> None:
-        self.call_next(log_exceptions(callback), *args, **kwargs)
+        self.call_next(_invoke_logging_exceptions, callback, *args, **kwargs)
 
     def on_ui_thread_wait(
         self,
@@ -250,12 +315,12 @@ class GdbCompatibleApp(App):
         *args: _P.args,
         **kwargs: _P.kwargs,
     ) -> _T | None:
-        if threading.current_thread() is self._thread:
+        if threading.get_ident() == self._thread.ident:
             self.configuration.handle_fatal_error(
                 msg=f"on_ui_thread_wait cannot be executed on the UI thread"
             )
 
-        return self.call_from_thread(log_exceptions(callback), *args, **kwargs)
+        return self.call_from_thread(_invoke_logging_exceptions, callback, *args, **kwargs)
 
     @staticmethod
     def on_gdb_thread(
@@ -263,16 +328,19 @@ class GdbCompatibleApp(App):
         *args: _P.args,
         **kwargs: _P.kwargs,
     ) -> None:
-        if not threading.main_thread().is_alive():
+        if not _MAIN_THREAD.is_alive():
             # This avoids crashes if the main thread already exited. We could avoid the same by
             # disconnecting on gdb_exiting but that's not supported by our current bundled GDB.
             return
 
-        if args or kwargs:
-            callback = functools.partial(callback, *args, **kwargs)
-
-        # Exceptions raised by the callback are already printed by GDB.
-        gdb.post_event(callback)
+        # Each posted event means a lock acquisition and a wakeup of GDB's event loop, so
+        # bursts of callbacks are queued and drained by one trampoline. Only the append
+        # that makes the queue non-empty schedules a drain; ordering is preserved.
+        with _gdb_pending_lock:
+            schedule_drain = not _gdb_pending
+            _gdb_pending.append((callback, args, kwargs))
+        if schedule_drain:
+            gdb.post_event(_drain_gdb_pending)
 
     def connect_event_thread_safe(
         self,
@@ -282,7 +350,9 @@ class GdbCompatibleApp(App):
         **predefined_kwargs,
     ) -> None:
         def wrapper(*runtime_args, **runtime_kwargs) -> None:
-            if self.get_instance() is self:
+            # Read the module global directly: this runs for every GDB event fired, and
+            # get_instance adds a method call plus an isinstance assert per event.
+            if _app_instance is self:
                 callback(
                     *predefined_args,
                     *runtime_args,
@@ -300,9 +370,11 @@ class GdbCompatibleApp(App):
     def _disconnect_events_now(self) -> None:
         assert threading.current_thread() is threading.main_thread()
 
-        for registry, callback in self._connected_gdb_events:
+        # Swap the list out first (atomic under the GIL) so the bookkeeping is consistent
+        # even if a disconnect callback re-entrantly touches it.
+        connected, self._connected_gdb_events = self._connected_gdb_events, []
+        for registry, callback in connected:
             registry.disconnect(callback)
-        self._connected_gdb_events.clear()
 
     def _disconnect_events_thread_safe(self) -> None:
         self.on_gdb_thread(self._disconnect_events_now)
@@ -312,9 +384,7 @@ class GdbCompatibleApp(App):
         raise NotImplementedError
 
     def terminal_execute(self, command: str) -> None:
-        home = _make_ctrl_from_char("A")
-        clear_after_cursor = _make_ctrl_from_char("K")
         os.write(
             self.configuration.gdb_io_fd,
-            f"{home}{clear_after_cursor}{command}\n".encode("utf-8"),
+            f"{_CLEAR_PROMPT_PREFIX}{command}\n".encode("utf-8"),
         )
@@ -5,7 +5,7 @@ import dataclasses
 import enum
 import fcntl
 import os
-import select
+import selectors
 import signal
 import struct
 import sys
@@ -112,7 +112,7 @@ class Configuration:
         with contextlib.ExitStack() as exit_stack:
             for std_base_name, file in zip(
                 ("stdin", "stdout", "stderr"),
-                self.real_tty_streams.file_objs(),
+                self.real_tty_streams.file_objs,
             ):
                 for std_name in (std_base_name, f"__{std_base_name}__"):
                     exit_stack.enter_context(
@@ -192,14 +192,35 @@ class Configuration:
     def _io_thread_func(self) -> None:
         from . import app
 
-        # It looks like programs never use more than 1KB even if here we allow a bigger buffer.
-        max_buff_size = 1024
+        # Bound once so the loop body doesn't chase the module and class attributes on
+        # every wakeup.
+        udb_app = app.UdbApp
+
+        # A single read returns whatever is currently buffered, so a large size means one
+        # wakeup (select plus read plus write) per burst of output rather than one per KB.
+        # The buffer is allocated once and filled in place with readv: forwarding is a
+        # pure byte copy, so there's no reason to allocate a fresh bytes object per
+        # wakeup. Consumers copy what they need before the next read overwrites it.
+        max_buff_size = 65536
+        read_buff = memoryview(bytearray(max_buff_size))
+
+        # The file descriptors are registered once instead of handing select a freshly
+        # built list to scan on every wakeup. Stdin is only watched while the app is not
+        # running: once it is, the app itself reads the real TTY.
+        selector = selectors.DefaultSelector()
+        selector.register(self.gdb_io_fd, selectors.EVENT_READ)
+        selector.register(self.io_thread_ipc_queue.waitable_fd, selectors.EVENT_READ)
+        stdin_registered = False
 
         while True:
-            read_fds = [self.gdb_io_fd, self.io_thread_ipc_queue.waitable_fd]
-            if not app.UdbApp.running():
-                read_fds.append(self.real_tty_streams.stdin_fd)
-            readable, _, _ = select.select(read_fds, [], [])
+            if udb_app.running() == stdin_registered:
+                if stdin_registered:
+                    selector.unregister(self.real_tty_streams.stdin_fd)
+                else:
+                    selector.register(self.real_tty_streams.stdin_fd, selectors.EVENT_READ)
+                stdin_registered = not stdin_registered
+
+            readable = [key.fd for key, _ in selector.select()]
 
             if self.io_thread_ipc_queue.waitable_fd in readable:
                 match self.io_thread_ipc_queue.receive():
@@ -216,19 +237,20 @@ class Configuration:
                             return
                     case IOThreadMessage.MAIN_THREAD_TERMINATED:
                         # Use an exception instead.
-                        if app.UdbApp.running():
-                            app.UdbApp.stop()
+                        if udb_app.running():
+                            udb_app.stop()
                         else:
                             return
                     case _ as unhandled:
                         raise ValueError(f"Invalid message: {unhandled!r}")
 
             if self.real_tty_streams.stdin_fd in readable:
-                buff = os.read(self.real_tty_streams.stdin_fd, max_buff_size)
-                os.write(self.gdb_io_fd, buff)
+                count = os.readv(self.real_tty_streams.stdin_fd, [read_buff])
+                os.write(self.gdb_io_fd, read_buff[:count])
                 continue
 
             if self.gdb_io_fd in readable:
-                buff = os.read(self.gdb_io_fd, max_buff_size)
-                if not app.UdbApp.process_output(buff):
+                count = os.readv(self.gdb_io_fd, [read_buff])
+                buff = read_buff[:count]
+                if not udb_app.process_output(buff):
                     os.write(self.real_tty_streams.stdout_fd, buff)
@@ -40,9 +40,11 @@ class Streams:
         # Were all TTYs pointing to the same device?
         return len(paths) == 1
 
-    def file_objs(self) -> Iterator[IO[str]]:
-        for fd, mode in zip(iter(self), "rww"):
-            yield os.fdopen(fd, mode, closefd=False)
+    @functools.cached_property
+    def file_objs(self) -> tuple[IO[str], ...]:
+        # Built once: fdopen allocates buffered and text wrappers with their own locks,
+        # and the descriptors in a Streams never change.
+        return tuple(os.fdopen(fd, mode, closefd=False) for fd, mode in zip(iter(self), "rww"))
 
 
 def allow_ctrl_c_handling(fd: int) -> None:
@@ -51,33 +53,39 @@ def allow_ctrl_c_handling(fd: int) -> None:
     termios.tcsetattr(fd, termios.TCSAFLUSH, mode)
 
 
+_RESET_CODES = "".join(
+    f"\N{ESCAPE}{c}"
+    for c in (
+        # Reset to initial state.
+        "c",
+        # Reset color and style.
+        "[0m",
+        # Select the default character set (in case the alternate one was selected producing
+        # weird drawings instead of normal characters).
+        "(B",
+        # Enable the cursor.
+        "[?25h",
+        # Erase the whole display (without affecting the cursor).
+        "[J",
+    )
+).encode("ascii")
+
+
 def reset_tty(fd: int) -> None:
     if not os.isatty(fd):
         return
 
-    # Return the terminal to the normal mode.
-    tty.setcbreak(fd, termios.TCSANOW)
+    # Return the terminal to the normal mode with a single attribute update rather than
+    # going through cbreak mode first; this also runs on the fatal error path where the
+    # fewer syscalls the better.
     mode = termios.tcgetattr(fd)
-    # Repostore canonical mode and echoing of input.
+    # Restore canonical mode and echoing of input.
     mode[tty.LFLAG] |= termios.ECHO | termios.ICANON
+    # Read byte by byte with no timeout, as cbreak mode would have left them.
+    mode[tty.CC][termios.VMIN] = 1
+    mode[tty.CC][termios.VTIME] = 0
     # Make \n imply a \r so printing works as normal in Python.
     mode[tty.OFLAG] |= termios.OPOST | termios.ONLCR
     termios.tcsetattr(fd, termios.TCSANOW, mode)
 
-    codes = [
-        f"\N{ESCAPE}{c}"
-        for c in (
-            # Reset to initial state.
-            "c",
-            # Reset color and style.
-            "[0m",
-            # Select the default character set (in case the alternate one was selected producing
-            # weird drawings instead of normal characters).
-            "(B",
-            # Enable the cursor.
-            "[?25h",
-            # Erase the whole display (without affecting the cursor).
-            "[J",
-        )
-    ]
-    os.write(fd, "".join(codes).encode("ascii"))
+    os.write(fd, _RESET_CODES)
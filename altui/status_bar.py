@@ -1,12 +1,20 @@
 from pathlib import Path
 
 from rich.console import RenderableType
+from rich.style import Style
 from rich.text import Text
 
 from textual.widget import Widget
 
 from src.udbpy import engine  # type: ignore[import]
 
+# The component class for each execution mode, precomputed so rendering doesn't reformat
+# the name every time.
+_EXECUTION_MODE_COMPONENT_NAME = {
+    mode: f"status-bar--execution-mode--{mode.name.lower().replace('_', '-')}"
+    for mode in engine.ExecutionMode
+}
+
 
 class StatusBar(Widget):
     COMPONENT_CLASSES = {
@@ -68,6 +76,9 @@ class StatusBar(Widget):
         self._source_path: Path | None = None
 
         self._content: Text | None = None
+        # Component styles looked up while generating content; walking the CSS is not
+        # free, and the styles only change when notify_style_update fires.
+        self._component_style_cache: dict[str, Style] = {}
 
     def update(
         self,
@@ -90,6 +101,7 @@ class StatusBar(Widget):
 
     def notify_style_update(self) -> None:
         self._content = None
+        self._component_style_cache.clear()
 
     def render(self) -> RenderableType:
         if self._content is None:
@@ -108,13 +120,13 @@ class StatusBar(Widget):
         msg = self._execution_mode.value.status_prompt_message
         if self._target_name:
             msg = f"{msg}: {self._target_name}"
-        execution_mode_component_name = self._execution_mode.name.lower().replace("_", "-")
-        text.append(
-            f" {msg} ",
-            self.get_component_rich_style(
-                f"status-bar--execution-mode--{execution_mode_component_name}"
-            ),
-        )
+        component_name = _EXECUTION_MODE_COMPONENT_NAME[self._execution_mode]
+        component_style = self._component_style_cache.get(component_name)
+        if component_style is None:
+            component_style = self._component_style_cache[component_name] = (
+                self.get_component_rich_style(component_name)
+            )
+        text.append(f" {msg} ", component_style)
 
         # Time and extent are both None or not None (see update), but mypy cannot know.
         if self._time is not None and self._time_extent is not None:
@@ -1,10 +1,8 @@
 from __future__ import annotations
 
 import asyncio
-import dataclasses
 import fcntl
 import functools
-import itertools
 import os
 import pty
 import re
@@ -13,7 +11,7 @@ import signal
 import struct
 import sys
 import termios
-from typing import Any, Callable, Iterator, Mapping
+from typing import Iterator, Mapping
 
 import pyte  # type: ignore
 import pyte.modes  # type: ignore
@@ -31,91 +29,71 @@ from textual.strip import Strip
 _ESC = "\N{ESCAPE}"
 _CSI = f"{_ESC}["
 _SS3 = f"{_ESC}O"
-_KEY_TO_ANSI = {
-    # "PC-Style Function Keys" section.
-    "up": f"{_SS3}A",
-    "down": f"{_SS3}B",
-    "right": f"{_SS3}C",
-    "left": f"{_SS3}D",
-    "home": f"{_SS3}H",
-    "end": f"{_SS3}F",
-    "F1": f"{_SS3}P",
-    "F2": f"{_SS3}Q",
-    "F3": f"{_SS3}R",
-    "F4": f"{_SS3}S",
-    "F5": f"{_CSI}15~",
-    "F6": f"{_CSI}17~",
-    "F7": f"{_CSI}18~",
-    "F8": f"{_CSI}19~",
-    "F9": f"{_CSI}20~",
-    "F10": f"{_CSI}21~",
-    "F11": f"{_CSI}23~",
-    "F12": f"{_CSI}24~",
-    # "VT220-Style Function Keys" section.
-    "delete": f"{_CSI}3~",
-    "pageup": f"{_CSI}5~",
-    "pagedown": f"{_CSI}6~",
+# The values are encoded once here rather than per keystroke in on_key.
+_KEY_TO_ANSI: Mapping[str, bytes] = {
+    key: value.encode("ascii")
+    for key, value in {
+        # "PC-Style Function Keys" section.
+        "up": f"{_SS3}A",
+        "down": f"{_SS3}B",
+        "right": f"{_SS3}C",
+        "left": f"{_SS3}D",
+        "home": f"{_SS3}H",
+        "end": f"{_SS3}F",
+        "F1": f"{_SS3}P",
+        "F2": f"{_SS3}Q",
+        "F3": f"{_SS3}R",
+        "F4": f"{_SS3}S",
+        "F5": f"{_CSI}15~",
+        "F6": f"{_CSI}17~",
+        "F7": f"{_CSI}18~",
+        "F8": f"{_CSI}19~",
+        "F9": f"{_CSI}20~",
+        "F10": f"{_CSI}21~",
+        "F11": f"{_CSI}23~",
+        "F12": f"{_CSI}24~",
+        # "VT220-Style Function Keys" section.
+        "delete": f"{_CSI}3~",
+        "pageup": f"{_CSI}5~",
+        "pagedown": f"{_CSI}6~",
+    }.items()
 }
 
 
-@dataclasses.dataclass(frozen=True)
-class _CharStyle:
-    fg_pyte_color: str
-    bg_pyte_color: str
-    bold: bool
-    italics: bool
-    underscore: bool
-    strikethrough: bool
-    reverse: bool
-
-    @classmethod
-    @functools.cache
-    def unstyled(cls) -> _CharStyle:
-        return _Char.from_pyte_char(pyte.screens.Char(" ")).style
-
-    @functools.lru_cache(maxsize=256)
-    def rich_style(self, default_rich_style: Style) -> Style:
-        return Style(
-            color=self._convert_color(self.fg_pyte_color, default_rich_style.color),
-            bgcolor=self._convert_color(self.bg_pyte_color, default_rich_style.bgcolor),
-            italic=self.italics,
-            underline=self.underscore,
-            strike=self.strikethrough,
-            reverse=self.reverse,
-        )
-
-    @staticmethod
-    def _convert_color(pyte_color: str, default_color: Color | None) -> Color | str | None:
-        if pyte_color == "default":
-            return default_color
-        if pyte_color == "brown":
-            # Pyte uses "brown" to mean "yellow", see `graphics.py` in the Pyte repository.
-            return "yellow"
-        if re.fullmatch("[0-9a-f]{6}", pyte_color, re.IGNORECASE):
-            return "#" + pyte_color
-        return pyte_color
-
-
-@dataclasses.dataclass(frozen=True)
-class _Char:
-    data: str
-    style: _CharStyle
-
-    @classmethod
-    def from_pyte_char(cls, pyte_char: pyte.screens.Char) -> _Char:
-        assert pyte_char.data is not None
-        return cls(
-            data=pyte_char.data,
-            style=_CharStyle(
-                fg_pyte_color=pyte_char.fg,
-                bg_pyte_color=pyte_char.bg,
-                bold=pyte_char.bold,
-                italics=pyte_char.italics,
-                underscore=pyte_char.underscore,
-                strikethrough=pyte_char.strikethrough,
-                reverse=pyte_char.reverse,
-            ),
-        )
+_HEX_COLOR_RE = re.compile("[0-9a-f]{6}", re.IGNORECASE)
+
+
+def _convert_color(pyte_color: str, default_color: Color | None) -> Color | str | None:
+    if pyte_color == "default":
+        return default_color
+    if pyte_color == "brown":
+        # Pyte uses "brown" to mean "yellow", see `graphics.py` in the Pyte repository.
+        return "yellow"
+    if len(pyte_color) == 6 and _HEX_COLOR_RE.fullmatch(pyte_color):
+        return "#" + pyte_color
+    return pyte_color
+
+
+# Styles are compared per character cell but a whole screen typically uses only a handful
+# of distinct ones, so converting pyte attributes into a rich Style is memoized on them.
+@functools.lru_cache(maxsize=1024)
+def _rich_style_from_pyte(
+    fg_pyte_color: str,
+    bg_pyte_color: str,
+    italics: bool,
+    underscore: bool,
+    strikethrough: bool,
+    reverse: bool,
+    default_rich_style: Style,
+) -> Style:
+    return Style(
+        color=_convert_color(fg_pyte_color, default_rich_style.color),
+        bgcolor=_convert_color(bg_pyte_color, default_rich_style.bgcolor),
+        italic=italics,
+        underline=underscore,
+        strike=strikethrough,
+        reverse=reverse,
+    )
 
 
 _ScreenBufferLine = Mapping[int, pyte.screens.Char]
@@ -127,20 +105,6 @@ class _Screen(pyte.HistoryScreen):
     def __init__(self, columns: int = 80, lines: int = 24, history: int = 1_000) -> None:
         super().__init__(columns=columns, lines=lines, history=history)
 
-        for event_name in pyte.Stream.events:
-            original_event_func: Callable[..., Any] = getattr(self, event_name)
-
-            def wrapped_event_func(
-                *args: Any,
-                _event_name: str = event_name,
-                _original_event_func: Callable[..., Any] = original_event_func,
-                **kwargs: Any,
-            ) -> Any:
-                result = _original_event_func(*args, **kwargs)
-                return result
-
-            setattr(self, event_name, wrapped_event_func)
-
     @property
     def virtual_lines(self) -> int:
         return len(self.history.top) + self.lines + len(self.history.bottom)
@@ -149,10 +113,18 @@ class _Screen(pyte.HistoryScreen):
         if n < 0:
             raise IndexError(f"Negative indices not supported: {n}")
 
-        for d in self.history.top, self.buffer, self.history.bottom:
-            if n < len(d):
-                return d[n]
-            n -= len(d)
+        # Dispatch with direct arithmetic rather than looping over the three containers;
+        # this runs once per rendered line per refresh.
+        top = self.history.top
+        if n < len(top):
+            return top[n]
+        n -= len(top)
+        if n < len(self.buffer):
+            return self.buffer[n]
+        n -= len(self.buffer)
+        bottom = self.history.bottom
+        if n < len(bottom):
+            return bottom[n]
 
         return {}
 
@@ -264,16 +236,41 @@ class Terminal(ScrollView, can_focus=True):
 
         self._update_sizes()
         self.scroll_end(animate=False)
-        for line in self._screen.virtual_dirty:
+
+        # Coalesce runs of consecutive dirty lines into one region each: a screen-wide
+        # update (a clear followed by a redraw, say) would otherwise cost one refresh per
+        # line.
+        scroll_y = self.scroll_offset.y
+        width = self.size.width
+        span_start: int | None = None
+        span_end = 0
+
+        def refresh_span() -> None:
+            assert span_start is not None
             self.refresh(
                 Region(
                     x=0,
-                    y=line - self.scroll_offset.y,
-                    width=self.size.width,
-                    height=1,
+                    y=span_start - scroll_y,
+                    width=width,
+                    height=span_end - span_start + 1,
                 )
             )
 
+        for line in sorted(self._screen.virtual_dirty):
+            if span_start is None:
+                span_start = span_end = line
+            elif line == span_end + 1:
+                span_end = line
+            else:
+                refresh_span()
+                span_start = span_end = line
+        if span_start is not None:
+            refresh_span()
+
+        # Once the refreshes are queued the lines aren't dirty any more; pyte leaves
+        # clearing this set to its users.
+        self._screen.dirty.clear()
+
     def render_line(self, y: int) -> Strip:
         # FIXME: do some caching?
         # FIXME: consider scroll_x
@@ -299,32 +296,51 @@ class Terminal(ScrollView, can_focus=True):
         return strip
 
     def _styled_chunks(self, y: int) -> Iterator[tuple[str, Style]]:
-        last_style = _CharStyle.unstyled()
-        pending_text: list[str] = []
-        for char in itertools.chain(self._chars_for_line(y), [None]):
-            if char is None or char.style != last_style:
-                text = "".join(pending_text)
-                if text:  # Avoid yielding an initial empty string for every line.
-                    yield text, last_style.rich_style(self.rich_style)
-                if char is not None:
-                    pending_text = [char.data]
-                    last_style = char.style
-            else:
-                pending_text.append(char.data)
-
-    def _chars_for_line(self, y: int) -> Iterator[_Char]:
         pyte_chars = self._screen.content_at_virtual_line(y)
         if not pyte_chars:
             return
-        # Explain it's defaultdict
-        for i in range(max(pyte_chars.keys()) + 1):
-            yield _Char.from_pyte_char(pyte_chars[i])
+
+        default_rich_style = self.rich_style
+        # Group directly over the raw pyte characters, comparing the style attributes as a
+        # plain tuple: a full repaint touches every cell, so per-character wrapper objects
+        # would dominate the render cost.
+        last_style: tuple | None = None
+        pending_text: list[str] = []
+        # The buffer line is a defaultdict, so looking up a missing cell yields a blank.
+        # The screen's column count bounds the loop rather than scanning the line for its
+        # widest stored cell; anything past the current width (history lines from before
+        # a narrowing, say) is cropped by the compositor anyway as scroll_x is unused.
+        for i in range(self._screen.columns):
+            char = pyte_chars[i]
+            style = (
+                char.fg,
+                char.bg,
+                char.italics,
+                char.underscore,
+                char.strikethrough,
+                char.reverse,
+            )
+            if style != last_style:
+                if pending_text:
+                    assert last_style is not None
+                    yield "".join(pending_text), _rich_style_from_pyte(
+                        *last_style, default_rich_style
+                    )
+                pending_text = [char.data]
+                last_style = style
+            else:
+                pending_text.append(char.data)
+        if pending_text:
+            assert last_style is not None
+            yield "".join(pending_text), _rich_style_from_pyte(*last_style, default_rich_style)
 
     async def on_key(self, event: events.Key) -> None:
         event.stop()
-        char = _KEY_TO_ANSI.get(event.key) or event.character
-        if char is not None:
-            self._write(char)
+        buff = _KEY_TO_ANSI.get(event.key)
+        if buff is None and event.character is not None:
+            buff = event.character.encode("utf-8")
+        if buff is not None:
+            self._write(buff)
 
     def on_paste(self, event: events.Paste) -> None:
         # By stripping newlines that the user may have accidentally included we avoid executing
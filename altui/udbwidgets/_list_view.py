@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import dataclasses
-from typing import Callable, Generic, TypeVar, cast
+import functools
+from typing import Callable, Generic, Iterable, TypeVar, cast
 
 import rich.repr
+from rich.style import Style
 from rich.text import Text
 from textual import containers, events, on, widgets
 from textual.app import App, ComposeResult
@@ -26,7 +28,14 @@ def _not_implemented(use_instead: str | None = None) -> Callable:
     return wrapper
 
 
-@dataclasses.dataclass
+# Shared by the class attributes below: the wrappers behave identically for the same
+# use_instead, so there's no point building one closure per attribute.
+_not_implemented_plain = _not_implemented()
+_use_append_instead = _not_implemented("append")
+
+
+# One instance exists per row, so skip the per-instance __dict__.
+@dataclasses.dataclass(slots=True)
 class UdbListViewCellType(Generic[_T]):
     rendered: Text
     primary: str
@@ -59,11 +68,11 @@ class UdbListView(UdbTable[UdbListViewCellType[_T]], Generic[_T]):
     }
     """
 
-    add_column = _not_implemented()
-    add_columns = _not_implemented()
-    add_row = _not_implemented("append")
-    add_rows = _not_implemented("append")
-    remove_row = _not_implemented()
+    add_column = _not_implemented_plain
+    add_columns = _not_implemented_plain
+    add_row = _use_append_instead
+    add_rows = _use_append_instead
+    remove_row = _not_implemented_plain
 
     class ItemSelected(Message, Generic[_U], bubble=True):
         def __init__(
@@ -99,6 +108,10 @@ class UdbListView(UdbTable[UdbListViewCellType[_T]], Generic[_T]):
         disabled: bool = False,
     ) -> None:
         self._max_row_width = 0
+        self._last_applied_width = -1
+        # The scrollable region width, captured by the layout watchers so appends don't
+        # have to query the layout for it.
+        self._region_width = 0
         self._content: list[UdbListViewCellType] = []
 
         super().__init__(
@@ -121,27 +134,58 @@ class UdbListView(UdbTable[UdbListViewCellType[_T]], Generic[_T]):
         pass
 
     def _update_content_width(self) -> None:
-        next(iter(self.columns.values())).width = max(
-            self.scrollable_content_region.width - 2,
+        target_width = max(
+            self._region_width - 2,
             self._max_row_width,
         )
+        # Writing the column width isn't free, so skip it when nothing changed (the
+        # common case for appends into a list whose widest row is already present).
+        if target_width == self._last_applied_width:
+            return
+        self._last_applied_width = target_width
+        next(iter(self.columns.values())).width = target_width
+
+    def _refresh_region_width(self) -> None:
+        self._region_width = self.scrollable_content_region.width
+        self._update_content_width()
 
     def _watch_virtual_region(self) -> None:
-        self._update_content_width()
+        self._refresh_region_width()
 
     def _watch_show_vertical_scrollbar(self) -> None:
-        self._update_content_width()
+        self._refresh_region_width()
 
     def _on_resize(self, event: events.Resize) -> None:
         # The event is needed to avoid pylint warning that the base method is different.
-        self._update_content_width()
+        self._refresh_region_width()
+
+    # Walking the CSS for the component styles on every row dominates bulk-population
+    # cost, hence the caching; after the first access these are plain attribute reads.
+    @functools.cached_property
+    def _primary_style(self) -> Style:
+        return self.get_component_rich_style("rich-list-view--text-primary", partial=True)
+
+    @functools.cached_property
+    def _secondary_style(self) -> Style:
+        return self.get_component_rich_style("rich-list-view--text-secondary", partial=True)
+
+    def _drop_cached_styles(self) -> None:
+        self.__dict__.pop("_primary_style", None)
+        self.__dict__.pop("_secondary_style", None)
+
+    def notify_style_update(self) -> None:
+        self._drop_cached_styles()
+        super().notify_style_update()
 
     def _on_dark_change(self) -> None:
+        # Drop the cached styles first so the rows are rebuilt with the new ones.
+        self._drop_cached_styles()
         orig_cursor = self.cursor_coordinate
         orig_content = self._content
         self.clear()
-        for cell in orig_content:
-            self.append(cell.primary, cell.secondary, cell.extra)
+        # Reappend as one batch: extend updates the content width (and triggers the
+        # refresh that goes with it) once rather than per row.
+        self.extend((cell.primary, cell.secondary, cell.extra) for cell in orig_content)
         self.move_cursor(row=orig_cursor.row, column=orig_cursor.column)
 
     def _on_data_table_cell_selected(self, event: widgets.DataTable.CellSelected) -> None:
@@ -161,23 +205,30 @@ class UdbListView(UdbTable[UdbListViewCellType[_T]], Generic[_T]):
         self._content.append(cell)
         return self
 
+    def extend(self, items: Iterable[tuple[str, str | None, _T | None]]) -> Self:
+        # Unlike repeated append calls, the content width (and the refresh its change
+        # triggers) is only updated once for the whole batch.
+        for primary, secondary, extra in items:
+            self._content.append(self._append_real(primary, secondary, extra, update_width=False))
+        self._update_content_width()
+        return self
+
     def _append_real(
         self,
         primary: str,
         secondary: str | None = None,
         extra: _T | None = None,
+        *,
+        update_width: bool = True,
     ) -> UdbListViewCellType[_T]:
         text = Text(
             primary,
-            self.get_component_rich_style("rich-list-view--text-primary", partial=True),
+            self._primary_style,
             no_wrap=True,
         )
         if secondary is not None:
             text.append("\n")
-            text.append(
-                secondary,
-                self.get_component_rich_style("rich-list-view--text-secondary", partial=True),
-            )
+            text.append(secondary, self._secondary_style)
 
         value = UdbListViewCellType[_T](
             rendered=text,
@@ -185,15 +236,22 @@ class UdbListView(UdbTable[UdbListViewCellType[_T]], Generic[_T]):
             secondary=secondary,
             extra=extra,
         )
-        super().add_row(
-            value,
-            height=len(text.split()),  # How many lines?
-        )
-
-        # cell_len on the whole Text counts the printable characters on all the lines.
-        text_width = max(t.cell_len for t in text.split())
-        self._max_row_width = max(self._max_row_width, text_width)
-        self._update_content_width()
+        # cell_len on the whole Text counts the printable characters on all the lines,
+        # hence the split; without a secondary (or a stray newline) there's one line and
+        # no need to split.
+        if secondary is None and "\n" not in primary:
+            height = 1
+            text_width = text.cell_len
+        else:
+            lines = text.split()
+            height = len(lines)  # How many lines?
+            text_width = max(t.cell_len for t in lines)
+        super().add_row(value, height=height)
+
+        if text_width > self._max_row_width:
+            self._max_row_width = text_width
+            if update_width:
+                self._update_content_width()
 
         return value
 
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import contextlib
 import functools
 from pathlib import Path
 
@@ -14,24 +13,29 @@ from textual import widgets
 from textual.app import App, ComposeResult
 from textual.reactive import reactive
 from textual.strip import Strip
-from typing_extensions import Self
 
 
-class _SourceOnlyStripsView:
-    def __init__(self, source_view: SourceView) -> None:
-        self._source_view = source_view
+# Lexer guessing and tokenization dominate file-switch latency, so recently viewed files
+# are kept around ready to show again. The modification time and size aren't used in the
+# body: they are part of the cache key so a file changed on disk is picked up afresh.
+@functools.lru_cache(maxsize=16)
+def _build_syntax(path: str, _mtime_ns: int, _size: int) -> rich.syntax.Syntax:
+    data = Path(path).read_bytes()
 
-    def _source_to_real_index(self, line: int) -> int:
-        return line - 1
+    # Decoding in memory means a non-UTF-8 file doesn't need reading a second time for
+    # the fallback encoding.
+    try:
+        content = data.decode("utf-8")
+    except UnicodeDecodeError:
+        content = data.decode("ascii", errors="backslashreplace")
 
-    def __getitem__(self, line: int) -> Strip:
-        return self._source_view.lines[self._source_to_real_index(line)]
-
-    def __setitem__(self, line: int, value: Strip) -> None:
-        self._source_view.lines[self._source_to_real_index(line)] = value
-
-    def __len__(self) -> int:
-        return self._source_to_real_index(len(self._source_view.lines))
+    lexer = rich.syntax.Syntax.guess_lexer(path, content)
+    return rich.syntax.Syntax(
+        content,
+        lexer,
+        line_numbers=True,
+        theme="ansi_dark",
+    )
 
 
 class SourceView(widgets.TextLog):
@@ -61,17 +65,20 @@ class SourceView(widgets.TextLog):
         id: str | None = None,  # pylint: disable=redefined-builtin
         classes: str | None = None,
     ) -> None:
-        self._restorable_source_strips: dict[int, Strip] = {}
+        # The current-line component style, resolved lazily; looking it up walks the
+        # component CSS and this runs on every step through the debuggee.
+        self._current_line_style: rich.style.Style | None = None
 
         super().__init__(name=name, id=id, classes=classes, auto_scroll=False)
 
-    @functools.cached_property
-    def _source_strips(self) -> _SourceOnlyStripsView:
-        return _SourceOnlyStripsView(self)
+    def _get_current_line_style(self) -> rich.style.Style:
+        if self._current_line_style is None:
+            self._current_line_style = self.get_component_rich_style("source-view--current-line")
+        return self._current_line_style
 
-    def clear(self) -> Self:
-        self._restorable_source_strips.clear()
-        return super().clear()
+    def notify_style_update(self) -> None:
+        self._current_line_style = None
+        super().notify_style_update()
 
     def watch_path(self, old: Path | None, new: Path | None) -> None:
         old = old.resolve() if old is not None else None
@@ -91,10 +98,8 @@ class SourceView(widgets.TextLog):
             return
 
         try:
-            try:
-                content = new.read_text(encoding="utf-8")
-            except UnicodeDecodeError:
-                content = new.read_text(encoding="ascii", errors="backslashreplace")
+            stat_result = new.stat()
+            syntax = _build_syntax(str(new), stat_result.st_mtime_ns, stat_result.st_size)
         except FileNotFoundError:
             self.placeholder = (
                 "File not found (in a future version we may show the assembly code instead)"
@@ -104,68 +109,44 @@ class SourceView(widgets.TextLog):
             self.placeholder = f"Cannot load file: {exc}"
             return
 
-        lexer = rich.syntax.Syntax.guess_lexer(str(new), content)
-        syntax = rich.syntax.Syntax(
-            content,
-            lexer,
-            line_numbers=True,
-            theme="ansi_dark",
-        )
         self.write(syntax)
 
     def validate_current_line(self, line: int | None) -> int | None:
-        if line is None or self.path is None or len(self._source_strips) == 0:
+        # Source lines are 1-based while the log's strips are 0-based, so the highest
+        # valid line number is one less than the strip count.
+        last_line = len(self.lines) - 1
+        if line is None or self.path is None or last_line == 0:
             return None
         else:
-            return max(
-                min(line, len(self._source_strips)),
-                1,
-            )
-
-    def _restore_line_style(self, line: int) -> None:
-        with contextlib.suppress(IndexError, KeyError):
-            self._source_strips[line] = self._restorable_source_strips[line]
+            return max(min(line, last_line), 1)
 
-    def _style_line(self, line: int, modifier: rich.style.Style) -> None:
-        self._restore_line_style(line)
+    def render_line(self, y: int) -> Strip:
+        strip = super().render_line(y)
 
-        original_strip = self._source_strips[line]
-        self._restorable_source_strips[line] = original_strip
+        line = self.current_line
+        if line is None or y + self.scroll_offset.y != line - 1:
+            return strip
 
-        segments = [
-            rich.segment.Segment(
-                segment.text,
-                rich.style.Style.chain(
-                    segment.style or rich.style.Style(),
-                    modifier,
-                ),
-                segment.control,
-            )
-            for segment in original_strip
-        ]
+        # The highlight is applied on demand as the line is rendered rather than by
+        # rewriting the stored strip: rapid stepping only pays for lines which actually
+        # become visible, and there's no saved original to restore when moving away.
+        # post_style layers the modifier on top of each segment's own style.
+        modifier = self._get_current_line_style()
+        segments = list(rich.segment.Segment.apply_style(strip, post_style=modifier))
 
         # FIXME: this is almost for sure the wrong way of doing it.
-        segments.append(
-            rich.segment.Segment(
-                " " * (self.scrollable_content_region.width - original_strip.cell_length),
-                modifier,
-            )
-        )
+        padding = self.scrollable_content_region.width - strip.cell_length
+        if padding > 0:
+            segments.append(rich.segment.Segment(" " * padding, modifier))
 
-        self._source_strips[line] = Strip(segments)
-        self._line_cache.clear()
+        return Strip(segments)
 
     def watch_current_line(self, old: int | None, new: int | None) -> None:
-        # Clear.
-        if old is not None:
-            self._restore_line_style(old)
-
+        # The highlight itself is drawn by render_line; changing the reactive already
+        # repaints the widget, both here and where the old current line was.
         if new is None:
             return
 
-        # Highlight the new line.
-        self._style_line(new, self.get_component_rich_style("source-view--current-line"))
-
         # Scroll to make the new line visible (if necessary).
         first_visible_line = self.scroll_y
         last_visible_line = first_visible_line + self.scrollable_content_region.height
@@ -1,3 +1,5 @@
+import itertools
+
 from textual import containers, widgets
 from textual.app import App, ComposeResult
 from textual.widget import Widget
@@ -71,12 +73,11 @@ class UdbToolbar(containers.Horizontal):
 
     def on_mount(self) -> None:
         # The same could be done with the `+` or `~` selectors but textual doesn't support them.
-        for curr, nxt in zip(self.children, self.children[1:]):
-            match nxt:
-                case UdbToolbarSeparator():
-                    curr.add_class("followed-by-toolbar-separator")
-                case widgets.Button():
-                    curr.add_class("followed-by-button")
+        for curr, nxt in itertools.pairwise(self.children):
+            if isinstance(nxt, UdbToolbarSeparator):
+                curr.add_class("followed-by-toolbar-separator")
+            elif isinstance(nxt, widgets.Button):
+                curr.add_class("followed-by-button")
 
 
 class MyApp(App):